@@ -0,0 +1,84 @@
+"""Benchmark the timeseries reads with and without the connection pool.
+
+Without the pool, every query opens and closes its own connection, as
+`utils.database` did before the pool.
+"""
+
+import sqlite3
+import tempfile
+import time
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from os.path import join
+from typing import Iterator
+
+import numpy as np
+from synthetic import create_database, make_symbols, make_timeseries
+
+from utils import database
+
+
+class UnpooledConnections(database.ConnectionPool):
+    """Open a new connection for every read."""
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one read."""
+        conn = sqlite3.connect(self.database_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def measure(symbols: list[str], calls: int, seed: int) -> np.ndarray:
+    """Time reads of the full timeseries of random stocks, in ms."""
+    rng = np.random.default_rng(seed)
+    times = []
+    for symbol in rng.choice(symbols, calls):
+        start = time.perf_counter()
+        database.get_stock_timeseries(str(symbol), "2020-01-01")
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+
+def main(n_symbols: int, calls: int):
+    """Create a synthetic database and compare the reads.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks in the database
+    calls : int
+        The number of reads of each mode
+
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        path = join(folder, "benchmark.db")
+        create_database(path, make_timeseries(n_symbols))
+        database.STORAGE_BACKEND = "sqlite"
+
+        symbols = make_symbols(n_symbols)
+        for name, pool_class in [
+            ("unpooled", UnpooledConnections),
+            ("pooled", database.ConnectionPool),
+        ]:
+            database._pool = pool_class(path)
+            # The first reads warm up the page cache
+            measure(symbols, 10, seed=1)
+            times = measure(symbols, calls, seed=0)
+            database._pool.close()
+            print(
+                f"{name}: p50 {np.percentile(times, 50):.2f} ms, "
+                f"p99 {np.percentile(times, 99):.2f} ms "
+                f"({calls} reads of {n_symbols} stocks)"
+            )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    main(args.symbols, args.calls)
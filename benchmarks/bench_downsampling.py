@@ -0,0 +1,94 @@
+"""Benchmark the size of the timeseries graphs with and without downsampling.
+
+The graphs are built at the default plot width, and at a width wide enough
+for every daily trade to be kept, as they were before the downsampling,
+over six months and five years of daily trades.
+"""
+
+import base64
+import tempfile
+from argparse import ArgumentParser
+from os.path import join
+
+import dash
+from plotly.io.json import to_json_plotly
+from synthetic import create_database, make_symbols, make_timeseries
+
+from utils import database
+from utils.downsampling import DEFAULT_PLOT_WIDTH
+
+# The pages can only be imported once the application exists
+dash.Dash(__name__, use_pages=True, pages_folder="")
+from pages.performance_timeseries import (  # noqa: E402
+    START_DATE,
+    create_comparison_graph,
+    create_daily_trade_graph_graph,
+    create_performance_index_graph,
+)
+
+TIME_DELTAS = {"6m": "183D", "5y": "1826D"}
+# Wide enough for a bar or a point per daily trade of every line
+FULL_DETAIL_WIDTH = 10**6
+
+
+def measure(figure: dict) -> tuple[int, int]:
+    """Get the number of points and the size of the JSON of a figure."""
+    # The dates are float64 typed arrays, see `utils.figures`
+    n_points = sum(
+        len(base64.b64decode(trace["x"]["bdata"])) // 8
+        for trace in figure["data"]
+    )
+    return n_points, len(to_json_plotly(figure))
+
+
+def main(plot_width: int):
+    """Create a synthetic database and compare the graph sizes.
+
+    Parameters
+    ----------
+    plot_width : int
+        The width of the downsampled graphs, in pixels
+
+    """
+    symbols = make_symbols(2)
+    selected = symbols[0]
+    with tempfile.TemporaryDirectory() as folder:
+        path = join(folder, "benchmark.db")
+        create_database(path, make_timeseries(len(symbols)))
+        database.STORAGE_BACKEND = "sqlite"
+        database._pool = database.ConnectionPool(path)
+
+        for label, time_delta in TIME_DELTAS.items():
+            df = database.get_stock_timeseries(
+                selected, START_DATE, time_delta
+            )
+            prices = database.get_close_prices(symbols, START_DATE, time_delta)
+            builders = {
+                "candles": lambda width: create_daily_trade_graph_graph(
+                    df, selected, "Synthetic Inc.", width
+                ),
+                "perf. index": lambda width: create_performance_index_graph(
+                    df, selected, "Synthetic Inc.", width
+                ),
+                "with comparison": lambda width: create_comparison_graph(
+                    prices, selected, "performance_index_graph", width
+                ),
+            }
+            for name, build in builders.items():
+                before_points, before_size = measure(build(FULL_DETAIL_WIDTH))
+                after_points, after_size = measure(build(plot_width))
+                print(
+                    f"{label} {name}: {before_points} -> {after_points} "
+                    f"points, {before_size / 1000:.1f} kB -> "
+                    f"{after_size / 1000:.1f} kB ({plot_width} px)"
+                )
+
+        database._pool.close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--width", type=int, default=DEFAULT_PLOT_WIDTH)
+    args = parser.parse_args()
+
+    main(args.width)
@@ -0,0 +1,200 @@
+"""Benchmark the figure cache on a replayed log of requests.
+
+The requests of the timeseries graphs pick their stock by a Zipf
+popularity, with random plot types, date ranges, overlays in random click
+order and plot widths, and a share of them asks for a treemap of random
+sectors. The log is replayed without the cache, through a cold cache,
+through the warm cache, and through a new process that only shares the
+folder of the figures on disk.
+"""
+
+import sqlite3
+import tempfile
+import time
+from argparse import ArgumentParser
+from os.path import join
+from typing import Callable, Hashable
+
+import dash
+import numpy as np
+import plotly.graph_objects as go
+from synthetic import SECTORS, create_database, make_symbols, make_timeseries
+
+# isort: split
+# The modules of `database/` are importable once `synthetic` is imported
+from metrics import refresh_stock_metrics
+
+from utils import database
+from utils.cache import FigureCache
+from utils.market import MarketHierarchy
+
+# The pages can only be imported once the application exists
+dash.Dash(__name__, use_pages=True, pages_folder="")
+from pages.performance_timeseries import (  # noqa: E402
+    METRIC_OVERLAYS,
+    PLOT_WIDTH_STEP,
+    START_DATE,
+    add_metric_overlays,
+    create_daily_trade_graph_graph,
+    create_performance_index_graph,
+)
+
+PLOT_TYPES = ["daily_trade_graph", "performance_index_graph"]
+TIME_DELTAS = ["183D", "365D", "ytd", "1826D"]
+TREEMAP_SHARE = 0.24
+# The default of the market overview page
+TREEMAP_TOP_N = 20
+
+
+def make_requests(
+    symbols: list[str], n_requests: int, seed: int
+) -> list[tuple[Hashable, Callable[[], go.Figure | dict]]]:
+    """Get the keys and the renderers of a log of requests.
+
+    The keys are normalized as the callbacks of the pages do: the overlays
+    are sorted in their drawing order and the widths rounded up.
+    """
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, len(symbols) + 1)
+    popularity /= popularity.sum()
+    hierarchy = MarketHierarchy(database.get_market_snapshot())
+
+    requests = []
+    for _ in range(n_requests):
+        if rng.random() < TREEMAP_SHARE:
+            sectors = sorted(
+                map(
+                    str,
+                    rng.choice(
+                        SECTORS, rng.integers(1, len(SECTORS) + 1), False
+                    ),
+                )
+            )
+            values = str(rng.choice(["market_cap", "volume"]))
+            key = ("treemap", tuple(sectors), values)
+            requests.append(
+                (
+                    key,
+                    lambda sectors=sectors, values=values: go.Figure(
+                        hierarchy.to_treemap(
+                            sectors, values, top_n=TREEMAP_TOP_N
+                        )
+                    ),
+                )
+            )
+            continue
+
+        symbol = str(rng.choice(symbols, p=popularity))
+        plot_type = str(rng.choice(PLOT_TYPES))
+        time_delta = str(rng.choice(TIME_DELTAS))
+        clicked = rng.permutation(list(METRIC_OVERLAYS))[: rng.integers(3)]
+        overlays = [column for column in METRIC_OVERLAYS if column in clicked]
+        plot_width = (
+            -(-int(rng.integers(800, 1800)) // PLOT_WIDTH_STEP)
+            * PLOT_WIDTH_STEP
+        )
+        key = (symbol, plot_type, time_delta, tuple(overlays), plot_width)
+        requests.append((key, lambda key=key: render_graph(*key)))
+    return requests
+
+
+def render_graph(
+    symbol: str,
+    plot_type: str,
+    time_delta: str,
+    overlays: tuple[str, ...],
+    plot_width: int,
+) -> dict:
+    """Render the graph of one stock as the timeseries page does."""
+    df = database.get_stock_timeseries(symbol, START_DATE, time_delta)
+    create_graph = (
+        create_daily_trade_graph_graph
+        if plot_type == "daily_trade_graph"
+        else create_performance_index_graph
+    )
+    fig = create_graph(df, symbol, f"{symbol} Inc.", plot_width)
+    if overlays:
+        fig = add_metric_overlays(
+            fig,
+            database.get_stock_metrics(symbol, START_DATE, time_delta),
+            list(overlays),
+            (
+                df["price_close"].iloc[0]
+                if plot_type == "performance_index_graph"
+                else None
+            ),
+            plot_width,
+        )
+    return fig
+
+
+def replay(
+    figures: FigureCache,
+    requests: list[tuple[Hashable, Callable[[], go.Figure | dict]]],
+    version: tuple[int, ...],
+) -> str:
+    """Replay requests through a figure cache and summarize the pass."""
+    before = figures.stats()
+    times = []
+    for key, render in requests:
+        start = time.perf_counter()
+        figures.get_or_render(key, render, version=version)
+        times.append(time.perf_counter() - start)
+    times = np.array(times) * 1000
+
+    # The counters of the cache add up over the passes
+    after = figures.stats()
+    hits = sum(after[c] - before[c] for c in ("hits", "disk_hits"))
+    return (
+        f"hit ratio {hits / len(requests):.0%}, mean {times.mean():.1f} ms, "
+        f"p95 {np.percentile(times, 95):.1f} ms, "
+        f"memory {after['bytes'] / 2**20:.1f} MiB"
+    )
+
+
+def main(n_symbols: int, n_requests: int):
+    """Create a synthetic database and replay a log of requests.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks in the database
+    n_requests : int
+        The number of requests of the log
+
+    """
+    symbols = make_symbols(n_symbols)
+    with tempfile.TemporaryDirectory() as folder:
+        path = join(folder, "benchmark.db")
+        cache_dir = join(folder, "figures")
+        create_database(path, make_timeseries(n_symbols))
+        conn = sqlite3.connect(path)
+        refresh_stock_metrics(conn)
+        conn.close()
+        database.STORAGE_BACKEND = "sqlite"
+        database._pool = database.ConnectionPool(path)
+        version = database.get_data_version()
+
+        requests = make_requests(symbols, n_requests, seed=0)
+        figures = FigureCache("graphs", cache_dir=cache_dir)
+        passes = [
+            # Nothing is kept, so every request renders its figure
+            ("no cache", FigureCache("graphs", max_bytes=0, cache_dir=None)),
+            ("cold cache", figures),
+            ("warm cache", figures),
+            # Only the figures on disk are shared with the first process
+            ("new process", FigureCache("graphs", cache_dir=cache_dir)),
+        ]
+        for name, pass_figures in passes:
+            print(f"{name}: {replay(pass_figures, requests, version)}")
+
+        database._pool.close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+
+    main(args.symbols, args.requests)
@@ -0,0 +1,108 @@
+"""Benchmark the figure builders of the timeseries page.
+
+Each figure is built from the frames read from a synthetic database and
+encoded into the JSON sent to the browser, as a miss of the figure cache
+does, over one and five years of daily trades.
+"""
+
+import tempfile
+import time
+from argparse import ArgumentParser
+from os.path import join
+from typing import Callable
+
+import dash
+import numpy as np
+from plotly.io.json import to_json_plotly
+from synthetic import create_database, make_symbols, make_timeseries
+
+from utils import database
+
+# The pages can only be imported once the application exists
+dash.Dash(__name__, use_pages=True, pages_folder="")
+from pages.performance_timeseries import (  # noqa: E402
+    START_DATE,
+    create_comparison_graph,
+    create_daily_trade_graph_graph,
+    create_performance_index_graph,
+)
+
+TIME_DELTAS = {"1y": "365D", "5y": "1826D"}
+PLOT_WIDTH = 1200
+
+
+def measure(build: Callable[[], dict], runs: int) -> tuple[float, int]:
+    """Time the build and the encoding of a figure.
+
+    Returns
+    -------
+    tuple[float, int]
+        The median time in ms and the size of the JSON in bytes
+
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        body = to_json_plotly(build())
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000, len(body)
+
+
+def main(runs: int):
+    """Create a synthetic database and time every builder.
+
+    Parameters
+    ----------
+    runs : int
+        The number of builds of each figure, the median is printed
+
+    """
+    symbols = make_symbols(6)
+    selected = symbols[0]
+    with tempfile.TemporaryDirectory() as folder:
+        path = join(folder, "benchmark.db")
+        create_database(path, make_timeseries(len(symbols)))
+        database.STORAGE_BACKEND = "sqlite"
+        database._pool = database.ConnectionPool(path)
+
+        for label, time_delta in TIME_DELTAS.items():
+            df = database.get_stock_timeseries(
+                selected, START_DATE, time_delta
+            )
+            builders = {
+                "daily trade": lambda: create_daily_trade_graph_graph(
+                    df, selected, "Synthetic Inc.", PLOT_WIDTH
+                ),
+                "performance index": lambda: create_performance_index_graph(
+                    df, selected, "Synthetic Inc.", PLOT_WIDTH
+                ),
+            }
+            for n_compared in (1, 5):
+                prices = database.get_close_prices(
+                    symbols[: n_compared + 1], START_DATE, time_delta
+                )
+                builders[f"comparison, {n_compared}"] = lambda prices=prices: (
+                    create_comparison_graph(
+                        prices,
+                        selected,
+                        "performance_index_graph",
+                        PLOT_WIDTH,
+                    )
+                )
+
+            for name, build in builders.items():
+                ms, size = measure(build, runs)
+                print(
+                    f"{label} {name}: {ms:.2f} ms, {size / 2**10:.0f} KiB "
+                    f"(median of {runs} runs, {PLOT_WIDTH} px)"
+                )
+
+        database._pool.close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    main(args.runs)
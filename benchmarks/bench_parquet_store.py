@@ -0,0 +1,104 @@
+"""Benchmark the reads of the daily trades from SQLite and from Parquet.
+
+The same synthetic trades are stored in a database and converted into the
+partitioned Parquet dataset, and the reads of the pages are timed through
+`utils.database` with each storage backend.
+"""
+
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+from os.path import getsize, join
+from typing import Callable
+
+import numpy as np
+from synthetic import create_database, make_symbols, make_timeseries
+
+# isort: split
+# The modules of `database/` are importable once `synthetic` is imported
+from convert_to_parquet import convert_to_parquet
+
+from utils import database, parquet_store
+
+
+def get_folder_size(path: str) -> int:
+    """Get the total size of the files in a folder, in bytes."""
+    return sum(
+        getsize(join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def measure(read: Callable[[], object], calls: int) -> np.ndarray:
+    """Time the calls of a read, in ms."""
+    times = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        read()
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+
+def main(n_symbols: int, calls: int):
+    """Store synthetic trades in both backends and compare the reads.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks
+    calls : int
+        The number of calls of each read
+
+    """
+    symbols = make_symbols(n_symbols)
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as folder:
+        database_path = join(folder, "benchmark.db")
+        parquet_path = join(folder, "timeseries.parquet")
+        create_database(database_path, make_timeseries(n_symbols))
+        convert_to_parquet(database_path, parquet_path)
+        database._pool = database.ConnectionPool(database_path)
+        parquet_store.PARQUET_PATH = parquet_path
+
+        print(
+            f"size: sqlite {getsize(database_path) / 2**20:.1f} MiB, "
+            f"parquet {get_folder_size(parquet_path) / 2**20:.1f} MiB"
+        )
+        reads = {
+            "one stock, full history": lambda: database.get_stock_timeseries(
+                str(rng.choice(symbols)), "2020-01-01"
+            ),
+            "one stock, 1y": lambda: database.get_stock_timeseries(
+                str(rng.choice(symbols)), "2020-01-01", "365D"
+            ),
+            "5 stocks, 1y close": lambda: database.get_close_prices(
+                list(rng.choice(symbols, 5, replace=False)),
+                "2020-01-01",
+                "365D",
+            ),
+            "latest snapshot": database.get_latest_trade_snapshot,
+        }
+        for name, read in reads.items():
+            for backend in ("sqlite", "parquet"):
+                database.STORAGE_BACKEND = backend
+                # The first reads warm up the caches
+                measure(read, 5)
+                times = measure(read, calls)
+                print(
+                    f"{name}, {backend}: "
+                    f"p50 {np.percentile(times, 50):.2f} ms, "
+                    f"p99 {np.percentile(times, 99):.2f} ms"
+                )
+
+        database._pool.close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=1100)
+    parser.add_argument("--calls", type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.symbols, args.calls)
@@ -0,0 +1,123 @@
+"""Benchmark the named queries against the string-formatted ones.
+
+Before the named queries, the values were formatted into the SQL text, so
+every symbol gave a new statement that SQLite had to prepare again. The
+bound statements of `NAMED_QUERIES` are prepared once per connection and
+reused from its statement cache. The queries are timed on a cursor, which
+shows the cost of the preparation, and through `utils.database`, which
+adds the reading into a DataFrame.
+"""
+
+import tempfile
+import time
+from argparse import ArgumentParser
+from os.path import join
+from typing import Callable
+
+import numpy as np
+from synthetic import create_database, make_symbols, make_timeseries
+
+from utils import database
+
+# The last week of trades, so that the preparation of the statements is not
+# hidden by the reading of the rows
+START_DATE = "2025-04-07"
+MODIFIER = "-7 days"
+
+# The queries as they were written before the named queries, and the
+# parameters of the named queries for a symbol
+QUERIES = {
+    "timeseries_by_symbol": (
+        "SELECT * FROM stock_timeseries WHERE symbol = '{symbol}' "
+        f"AND date >= '{START_DATE}' ORDER BY date",
+        lambda symbol: (symbol, START_DATE),
+    ),
+    "timeseries_by_symbol_window": (
+        "SELECT * FROM stock_timeseries WHERE symbol = '{symbol}' "
+        f"AND date >= '{START_DATE}' AND date >= (SELECT date(MAX(date), "
+        f"'{MODIFIER}') FROM stock_timeseries WHERE symbol = '{{symbol}}') "
+        "ORDER BY date",
+        lambda symbol: {
+            "symbol": symbol,
+            "start_date": START_DATE,
+            "modifier": MODIFIER,
+        },
+    ),
+}
+
+
+def fetch_rows(query: str, params: tuple | dict = ()) -> list[tuple]:
+    """Fetch the rows of a query from a pooled connection."""
+    with database.get_connection_pool().reader() as conn:
+        return conn.execute(query, params).fetchall()
+
+
+def measure(
+    read: Callable[[str], object], symbols: list[str], calls: int, seed: int
+) -> np.ndarray:
+    """Time the reads of random stocks, in us."""
+    rng = np.random.default_rng(seed)
+    times = []
+    for symbol in rng.choice(symbols, calls):
+        start = time.perf_counter()
+        read(str(symbol))
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1e6
+
+
+def main(n_symbols: int, calls: int):
+    """Create a synthetic database and compare the queries.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks in the database
+    calls : int
+        The number of reads of each query
+
+    """
+    symbols = make_symbols(n_symbols)
+    with tempfile.TemporaryDirectory() as folder:
+        path = join(folder, "benchmark.db")
+        create_database(path, make_timeseries(n_symbols))
+        database.STORAGE_BACKEND = "sqlite"
+        database._pool = database.ConnectionPool(path)
+
+        for name, (formatted, get_params) in QUERIES.items():
+            named = database.NAMED_QUERIES[name]
+            reads = {
+                "cursor, formatted": lambda symbol: fetch_rows(
+                    formatted.format(symbol=symbol)
+                ),
+                "cursor, named": lambda symbol: fetch_rows(
+                    named, get_params(symbol)
+                ),
+                "pandas, formatted": lambda symbol: (
+                    database.execute_select_query(
+                        formatted.format(symbol=symbol)
+                    )
+                ),
+                "pandas, named": lambda symbol: database.execute_named_query(
+                    name, get_params(symbol)
+                ),
+            }
+            for mode, read in reads.items():
+                # The first reads warm up the page cache
+                measure(read, symbols, 100, seed=1)
+                times = measure(read, symbols, calls, seed=0)
+                print(
+                    f"{name}, {mode}: "
+                    f"p50 {np.percentile(times, 50):.0f} us, "
+                    f"p99 {np.percentile(times, 99):.0f} us"
+                )
+
+        database._pool.close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=1100)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    main(args.symbols, args.calls)
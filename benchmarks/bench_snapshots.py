@@ -0,0 +1,81 @@
+"""Benchmark the rebuild of the database from CSV and Parquet snapshots.
+
+The CSV snapshot is written as `fetch_data.py` journals the daily trades,
+and the Parquet snapshot as it converts the journal. The rebuild reads the
+snapshot and loads it into an empty database, as
+`create_mock_database.py --populate-timeseries` does.
+"""
+
+import tempfile
+import time
+from argparse import ArgumentParser
+from os.path import getsize, join
+
+import pandas as pd
+from synthetic import create_empty_database, make_timeseries
+
+# isort: split
+# The modules of `database/` are importable once `synthetic` is imported
+from loader import load_timeseries
+from snapshots import read_snapshot, write_snapshot
+
+
+def measure_read(path: str) -> float:
+    """Time the read of a snapshot, in seconds."""
+    start = time.perf_counter()
+    for _ in read_snapshot(path):
+        pass
+    return time.perf_counter() - start
+
+
+def measure_rebuild(path: str, database_path: str, df: pd.DataFrame) -> float:
+    """Time the load of a snapshot into an empty database, in seconds."""
+    conn = create_empty_database(database_path, df)
+    start = time.perf_counter()
+    load_timeseries(conn, read_snapshot(path))
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def main(n_symbols: int, repeats: int):
+    """Write both snapshots of synthetic trades and compare them.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks in the snapshots
+    repeats : int
+        The number of runs of each measure, the fastest is printed
+
+    """
+    df = make_timeseries(n_symbols)
+    with tempfile.TemporaryDirectory() as folder:
+        paths = {
+            "csv": join(folder, "snapshot.csv"),
+            "parquet": join(folder, "snapshot.parquet"),
+        }
+        df.to_csv(paths["csv"], index=False)
+        write_snapshot(df, paths["parquet"])
+
+        for name, path in paths.items():
+            read_seconds = min(measure_read(path) for _ in range(repeats))
+            rebuild_seconds = min(
+                measure_rebuild(path, join(folder, f"{name}-{i}.db"), df)
+                for i in range(repeats)
+            )
+            print(
+                f"{name}: {getsize(path) / 2**20:.1f} MiB, "
+                f"read {read_seconds:.2f} s, "
+                f"rebuild {rebuild_seconds:.2f} s "
+                f"({len(df)} daily trades of {n_symbols} stocks)"
+            )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    main(args.symbols, args.repeats)
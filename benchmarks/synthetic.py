@@ -0,0 +1,134 @@
+"""Synthetic daily trades and databases for the benchmarks."""
+
+import sqlite3
+import sys
+from os.path import dirname, join, realpath
+
+import numpy as np
+import pandas as pd
+
+DATABASE_FOLDER = join(dirname(realpath(__file__)), "../database")
+sys.path.append(DATABASE_FOLDER)
+sys.path.append(join(dirname(realpath(__file__)), "../src"))
+from loader import (  # noqa: E402
+    TIMESERIES_COLUMNS,
+    load_timeseries,
+    refresh_market_snapshot,
+)
+from migrate import apply_migrations  # noqa: E402
+
+SECTORS = ["Technology", "Finance", "Health Care", "Energy", "Utilities"]
+
+
+def make_symbols(n_symbols: int) -> list[str]:
+    """Get the ticker symbols of the synthetic stocks.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks
+
+    """
+    return [f"S{i:04d}" for i in range(n_symbols)]
+
+
+def make_timeseries(
+    n_symbols: int,
+    start_date: str = "2020-01-01",
+    end_date: str = "2025-04-11",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Generate the daily trades of random walking stocks.
+
+    Parameters
+    ----------
+    n_symbols : int
+        The number of stocks
+    start_date : str, default "2020-01-01"
+        The first trading date
+    end_date : str, default "2025-04-11"
+        The last trading date
+    seed : int, default 0
+        The seed of the random prices
+
+    Returns
+    -------
+    pd.DataFrame
+        The daily trades with `TIMESERIES_COLUMNS` and "%Y-%m-%d" dates
+
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start_date, end_date).strftime("%Y-%m-%d")
+    n_dates = len(dates)
+
+    price_close = 50 * np.exp(
+        np.cumsum(rng.normal(0, 0.02, (n_symbols, n_dates)), axis=1)
+    )
+    price_open = price_close * (1 + rng.normal(0, 0.01, price_close.shape))
+    return pd.DataFrame(
+        {
+            "symbol": np.repeat(make_symbols(n_symbols), n_dates),
+            "date": np.tile(dates, n_symbols),
+            "price_open": price_open.ravel(),
+            "price_close": price_close.ravel(),
+            "price_low": np.minimum(price_open, price_close).ravel() * 0.99,
+            "price_high": np.maximum(price_open, price_close).ravel() * 1.01,
+            "volume": rng.integers(1_000, 10_000_000, price_close.size).astype(
+                "float64"
+            ),
+        }
+    )[TIMESERIES_COLUMNS]
+
+
+def create_empty_database(path: str, df: pd.DataFrame) -> sqlite3.Connection:
+    """Create a migrated database with the stocks of daily trades only.
+
+    Parameters
+    ----------
+    path : str
+        The path to the new database
+    df : pd.DataFrame
+        The daily trades from `make_timeseries`
+
+    Returns
+    -------
+    sqlite3.Connection
+        The connection to the new database
+
+    """
+    symbols = df["symbol"].unique()
+    conn = sqlite3.connect(path)
+    with open(join(DATABASE_FOLDER, "database_schema.sql")) as sql_file:
+        conn.executescript(sql_file.read())
+    apply_migrations(conn)
+
+    pd.DataFrame(
+        {
+            "symbol": symbols,
+            "name": [f"{symbol} Inc." for symbol in symbols],
+            "country": "United States",
+            "volume": df.groupby("symbol", sort=False)["volume"]
+            .last()
+            .to_numpy(),
+            "sector": [SECTORS[i % len(SECTORS)] for i in range(len(symbols))],
+            "industry": "Industry",
+        }
+    ).to_sql("stock_details", conn, if_exists="append", index=False)
+    return conn
+
+
+def create_database(path: str, df: pd.DataFrame):
+    """Create a migrated database holding daily trades.
+
+    Parameters
+    ----------
+    path : str
+        The path to the new database
+    df : pd.DataFrame
+        The daily trades from `make_timeseries`
+
+    """
+    conn = create_empty_database(path, df)
+    load_timeseries(conn, [df])
+    refresh_market_snapshot(conn)
+    conn.close()